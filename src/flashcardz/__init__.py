@@ -0,0 +1,21 @@
+# -*- coding: utf-8 -*-
+"""
+flashcardz package.  The program itself lives in flashcardz/flashcardz.py.
+
+That module is not imported here.  Instead it is loaded on first access to
+one of its functions (PEP 562).  "from flashcardz import *" works as before,
+and "import flashcardz" on its own costs next to nothing.
+"""
+
+__all__ = ['add', 'cards', 'delete', 'functions', 'go', 'main', 'settings']
+
+
+def __getattr__(name):
+    if name in __all__ or name == '__version__':
+        from . import flashcardz as _flashcardz
+        return getattr(_flashcardz, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
@@ -0,0 +1,7 @@
+# -*- coding: utf-8 -*-
+"""Allows flashcardz to be started with "python -m flashcardz"."""
+
+import sys
+from flashcardz import main
+
+sys.exit(main())
@@ -32,19 +32,27 @@ import time
 from pathlib import Path
 import csv
 from difflib import get_close_matches
+from itertools import islice
+from functools import lru_cache
 import sys
 import os
 import ast
+import json
 import re
 import webbrowser
-import readline  # https://docs.python.org/3/library/readline.html
 import code
-import atexit
 
 
 __version__ = '0.1.0'   # PEP 440 - describes versions
 delimiter = '|'      # pipe symbol
 substitute = ';'     # if when file saved, save any pipe symbols as semicolons
+_is_win = sys.platform.startswith('win')    # MS Windows
+_is_lin = sys.platform.startswith('linux')  # Linux
+# [some text](a url).  Groups: '[some text]', ' (a url)' incl. any leading
+# white space, and 'a url' alone.
+_url_re = re.compile(r'(\[[^\]\n]+\])(\s*\(([^)\n]+)\))')
+_deck_cache = {'key': None, 'cards': None}  # last deck read by _open()
+_settings = None     # user's settings; read when first needed, see _get_settings()
 
 
 def _remains_at(setting):
@@ -174,28 +182,33 @@ def _setpathname():
     _currently_at('pathname')
     print("\nEnter pathname for new or existing file (e.g. C:\\mypath\\myfile.txt)")
     userinput = input(r'    Pathname (Enter nothing for no change) = ').strip()
-    fn = Path(userinput)
-    fn_resolved = fn.resolve()
+    if not userinput:  # no change; don't touch the filesystem
+        _remains_at('pathname')
+        return
+    fn_resolved = Path(userinput).resolve()
     current_fn = Path(_settings['pathname']).resolve()
-    if userinput and  fn_resolved.is_dir():
+    if fn_resolved.is_dir():
         print(f'\npathname cannot be a directory. You tried to create {fn_resolved}')
         _remains_at('pathname')
-    elif userinput and not fn_resolved.parent.exists():
+    elif not fn_resolved.parent.exists():
         print(f'\nParent directory {fn_resolved.parent} does not exist.')
         print('Withont a parent directory your file cannont be created.')
         _remains_at('pathname')
-    elif  userinput and fn_resolved == current_fn:
+    elif fn_resolved == current_fn:
         print("You didn't change the pathname.")
         _remains_at('pathname')
-    elif userinput and fn_resolved.exists():
-        print('\nFile already exists.  Will use that file.')
-        _settings['pathname'] = str(fn_resolved)
-        _changed_to('pathname')
-    elif (userinput and not fn_resolved.exists()) or (userinput and fn_resolved.exists()):
-        _settings['pathname'] = str(fn_resolved)
-        _changed_to('pathname')
     else:
-        _remains_at('pathname')
+        try:  # make sure the new pathname can be saved before using it
+            _settings_text(dict(_settings, pathname=fn_resolved.as_posix()))
+        except ValueError:
+            print(f"\nPathname {str(fn_resolved)!r} can't be used.  "
+                  "Perhaps it contains a tab or other control character?")
+            _remains_at('pathname')
+            return
+        if fn_resolved.exists():
+            print('\nFile already exists.  Will use that file.')
+        _settings['pathname'] = fn_resolved.as_posix()
+        _changed_to('pathname')
 
 
 def settings():
@@ -216,6 +229,7 @@ def settings():
 
     """
     global _settings
+    _get_settings()
     print(settings.__doc__)
     print(f"(Settings are saved in file {_get_settingsfn()}.")
     print('If this file is erased, once flashcardz is rerun, file will be recreated')
@@ -355,12 +369,9 @@ def add(word, definition):
         _cards = _open()
         word = word.replace(delimiter, substitute)
         definition = definition.replace(delimiter, substitute)
+        word0 = _norm(word)
         for i, x in enumerate(_cards):
-            # word from _cards (x[0]), all white space removed, & lower case
-            x0 = ''.join(x[0].split()).lower()
-            # new word from user (word), all white space removed, & lower case
-            word0 = ''.join(word.split()).lower()
-            if x0 == word0:  # if word already in _cards, delete it to replace with new
+            if _norm(x[0]) == word0:  # if word already in _cards, delete it to replace with new
                 _cards.pop(i)
                 _cards.append([word, definition, x[2]])
                 break
@@ -374,6 +385,15 @@ def add(word, definition):
         print('add("pill", "a small round mass of solid medicine to be swallowed whole.")')
 
 
+def _norm(word):
+    '''
+    Reduce a word to the form used to decide if two cards are for the same
+    word: all white space removed and case folded.  (casefold() is like
+    lower(), but also matches letters such as ß and ss.)
+    '''
+    return ''.join(word.split()).casefold()
+
+
 def delete(number=None):
     '''
     Delete a card from the deck.  Use words(), head(), or tail() to see the
@@ -442,10 +462,12 @@ def _save(_cards):
     Elements of the list are strings execept for 'tally' which are integers.
 
     '''
+    _get_settings()
     if ('pathname' not in _settings or _settings['pathname'] == None
             or _settings['pathname'] == ""):
         _setpathname()
     fields = ['word', 'definition', 'tally']
+    _deck_cache['key'] = None
     try:
         fn = Path(_settings['pathname'])
         with open(fn, 'w', newline='', encoding='utf-8', errors='replace') as csvfile:  # w/o newline='', blank lines inserted with MS Windows
@@ -460,6 +482,48 @@ def _save(_cards):
         print(msg)
 
 
+def _iter_cards():
+    '''
+    Open the pathname specified in flashcardz' _settings and yield its cards
+    one at a time.  The file is only read as far as the caller iterates, so
+    a caller that wants a single card need not read the rest of the file.
+
+    Yields
+    ------
+    _card : list
+        A word, its definition, and its tally, i.e. [word, definition, tally]
+    '''
+    _get_settings()
+    if ('pathname' not in _settings or _settings['pathname'] == None
+            or _settings['pathname'] == ""):
+        _setpathname()
+
+    fn = Path(_settings['pathname'])
+
+    with open(fn, 'r', encoding='utf-8', errors='replace') as csvfile:
+        csvreader = csv.reader(csvfile, delimiter=delimiter)
+        for _card in csvreader:
+            ln = len(_card)
+            if 1 < ln < 3:
+                del _card[2:]
+                #_card.append(today)
+                #_card.append('0')
+                _card.append('0')
+            elif ln == 1:
+                print('\nSomething is wrong with your data file.  At least one line in the file contains\n'
+                       'data that would fill only one field, and not multiple fields, i.e. the word and\n'
+                       'description fields.  The most likely reason for this is that the file was not\n'
+                       'saved in a csv file format suitable for the flachcardz program.   The file\n'
+                       'should be a csv file that uses a pipe/vertical bar character, |, as a delimiter.')
+                sys.exit()
+            try:
+                _card[2] = max(0, int(_card[2]))
+            except ValueError:
+                _card[2] = 0
+            if not _card[0] == 'word':
+                yield _card
+
+
 def _open():
     '''
     Open the pathname specified in flashcardz' _settings, then read its
@@ -474,41 +538,70 @@ def _open():
         of a word.)
 
     '''
+    key = _deck_key()
+    if key is not None and key == _deck_cache['key']:
+        return [_card[:] for _card in _deck_cache['cards']]
+    _cards = []
     try:
-        if ('pathname' not in _settings or _settings['pathname'] == None
-                or _settings['pathname'] == ""):
-            _setpathname()
-
-        fn = Path(_settings['pathname'])
-
-        _cards = []
-        with open(fn, 'r', encoding='utf-8', errors='replace') as csvfile:
-            csvreader = csv.reader(csvfile, delimiter=delimiter)
-            for _card in csvreader:
-                ln = len(_card)
-                if 1 < ln < 3:
-                    del _card[2:]
-                    #_card.append(today)
-                    #_card.append('0')
-                    _card.append('0')
-                elif ln == 1:
-                    print('\nSomething is wrong with your data file.  At least one line in the file contains\n'
-                           'data that would fill only one field, and not multiple fields, i.e. the word and\n'
-                           'description fields.  The most likely reason for this is that the file was not\n'
-                           'saved in a csv file format suitable for the flachcardz program.   The file\n'
-                           'should be a csv file that uses a pipe/vertical bar character, |, as a delimiter.')
-                    sys.exit()
-                if not _card[2].isnumeric():
-                    _card[2] = '0'
-                if not _card[0] == 'word':
-                    _cards.append(_card)
+        for _card in _iter_cards():
+            _cards.append(_card)
     except Exception as e:
         msg = ('Error within function named "_open function".\n'
                + str(e))
         print(msg)
+    else:
+        if key is not None:
+            _deck_cache['key'] = key
+            _deck_cache['cards'] = [_card[:] for _card in _cards]
     return _cards
 
 
+def _deck_key():
+    '''
+    Identify the current state of the data file by its pathname, size, and
+    time last modified.  _open() uses this to tell if the deck it read last
+    time is still what is in the file.
+
+    Returns
+    -------
+    tuple | None
+        (pathname, size, mtime) or None if the file can't be found.
+    '''
+    try:
+        st = os.stat(_get_settings()['pathname'])
+    except (KeyError, TypeError, OSError):
+        return None
+    return (_settings['pathname'], st.st_size, st.st_mtime_ns)
+
+
+def _card_at(j):
+    '''
+    Get the card at position j of the data file.  If the deck last read by
+    _open() is still what is in the file, the card is taken from that.
+    Otherwise, for j >= 0, reading of the file stops once card j has been
+    read.
+
+    Parameters
+    ----------
+    j : int
+        Position of the card (as shown by cards()).  Negative values count
+        from the end of the deck.
+
+    Returns
+    -------
+    _card : list
+        [word, definition, tally]
+    '''
+    key = _deck_key()
+    if key is not None and key == _deck_cache['key']:
+        return _deck_cache['cards'][j][:]
+    if j < 0:
+        return _open()[j]
+    for _card in islice(_iter_cards(), j, None):
+        return _card
+    raise IndexError(f'card {j} does not exist')
+
+
 def cards(cmd=True, i=None):
     """From the cards' data file, show a list of all words with, or without,
     their defintions.
@@ -562,27 +655,25 @@ def cards(cmd=True, i=None):
 
     """
     try:
-        _cards = _open()
         separator = 35*'-'
+        if type(cmd) == int:
+            _card = _card_at(cmd)
+        else:
+            _cards = _open()
         if type(cmd) == int and i == None:
-            j = cmd
-            _card = _cards[j]
             desc = _hide_urls(_card[1])
             print(f'\n{_card[0]}\n\n{desc}')
         elif type(cmd) == int and isinstance(i, int) and i < 0:
-            j = cmd
-            _card = _cards[j]
             desc = _card[1]
             print(f'\n{_card[0]}\n\n{desc}')
         elif type(cmd) == int and isinstance(i, str) and i == '-0':
-            j = cmd
-            _card = _cards[j]
             desc = _card[1]
             print(f'\n{_card[0]}\n\n{desc}')
         elif type(cmd) == int and isinstance(i, int):
-            j = cmd
-            _card = _cards[j]
             webbrowser.open(_url_at(_card[1], i))
+        elif type(cmd) == int:
+            print(f'Error at function named cards: i = {i!r} is not valid.')
+            print('    i must be an integer or "-0".')
         elif type(cmd) == list:
             lst = cmd
             for j in lst:
@@ -611,7 +702,7 @@ def cards(cmd=True, i=None):
         print('    Data file nonexistant or corrupt?  Was csv file saved with | as delimiter?')
 
 
-def go(shuffle=True):
+def go(shuffle=True, limit=None):
     '''
     First the deck of cards in shuffled.  Then one by one each card is shown
     to the user.  First the word is shown.  The user looks at the word and
@@ -633,6 +724,10 @@ def go(shuffle=True):
     ----------
     shuffle : bool, optional
         Shuffle the deck. The default is True.
+    limit : int, optional
+        Show no more than this many cards.  If the deck is shuffled, the
+        cards shown are picked at random from the whole deck.  The default
+        is None, i.e. show all cards.
 
     Examples
     --------
@@ -642,7 +737,11 @@ def go(shuffle=True):
     # Shuffle the deck (True or 1, or enter no argument)
     >>> go()
 
+    # A short session: 20 cards picked at random from the deck
+    >>> go(limit=20)
+
     '''
+    _get_settings()
     print('\nEach word, followed by its definition, will be shown.  After a word is shown,')
     print("try to figure out its meaning.  Then press the Enter key to show the word's")
     print('definition.  The program will then ask "Meaning known? (Y/n/i/a/q)".')
@@ -670,22 +769,31 @@ def go(shuffle=True):
 
     _cards = _open()
     index_list = [i for i in range(0, len(_cards))]
+    if limit is not None:
+        limit = min(abs(int(limit)), len(_cards))
     if shuffle == True:
         print("\nShuffling cards ", end='')
         for i in range(15):
             print(">", end='')
             time.sleep(.08)
         print()
-        index_list = sorted(index_list, key=lambda x: random.random())
+        if limit is None:
+            random.shuffle(index_list)
+        else:  # only draw the cards that will be shown
+            index_list = random.sample(index_list, limit)
+    elif limit is not None:
+        index_list = index_list[:limit]
 
     number = 0
-    number_of_cards = len(_cards)
+    number_of_cards = len(index_list)
     abort = False
     unwanted = []
     missed = []
     print()
     correcttext = ('Meaning known? (Y/n/i/q) ' if _settings['abort']
                    else 'Meaning known? (Y/n/i/a/q) ')
+    maxtally = _settings['maxtally']
+    miss_reset = max(0,  maxtally - _settings['tallypenalty'])
 
     for k in index_list:
         number += 1
@@ -735,19 +843,19 @@ def go(shuffle=True):
                 print("    " + 75*"—")
             elif ans and ans[0].lower() == 'n':
                 print()
-                _cards[k][2] = max(0,  _settings['maxtally'] - _settings['tallypenalty'])
+                _cards[k][2] = miss_reset
                 missed.append(_cards[k])
                 loop = False
             elif ans and ans[0].lower() == 'y':
                 print()
-                _cards[k][2] = int(_cards[k][2]) + 1    # _cards[k][2] is "tally"
-                if _cards[k][2] >= _settings['maxtally']:
+                _cards[k][2] += 1    # _cards[k][2] is "tally"
+                if _cards[k][2] >= maxtally:
                     unwanted.append(k)
                 loop = False
             else:
                 print()
-                _cards[k][2] = int(_cards[k][2]) + 1
-                if _cards[k][2] >= _settings['maxtally']:
+                _cards[k][2] += 1
+                if _cards[k][2] >= maxtally:
                     unwanted.append(k)
                 loop = False
     print("\n             === The End ===")
@@ -760,29 +868,29 @@ def go(shuffle=True):
                 'Congradulations!  Max tally reached on the following.  Cards removed: \n')
         else:
             print('Congradulations!  Max tally reached on the following: \n')
-        # [::-1] reverses the list in order to remove latter elements first.
-        for ele in unwanted[::-1]:
+        for ele in reversed(unwanted):
             # ele is an element of the _cards list
             print(f'    {_cards[ele][0]}')
-            del _cards[ele]
+        # Remove all in one pass; del per card shifts the list's tail each time.
+        unwanted_set = set(unwanted)
+        _cards = [c for i, c in enumerate(_cards) if i not in unwanted_set]
         print()
         if not abort:
             print(f'\nNumber of cards is now {len(_cards)}\n')
 
     if missed:
         print('\n\n' + 50*'_')
-        percent_correct = str(
-            int(100 * (len(_cards) - len(missed))/len(_cards)))
-        if int(percent_correct) >= 80:
+        percent_correct = int(100 * (number_of_cards - len(missed))/number_of_cards)
+        if percent_correct >= 80:
             print(f'{percent_correct}% answered correctly!')
         else:
             print(f'{percent_correct}% answered correctly')
         print('These are the words you missed: \n')
+        positions = {}  # word -> its card number, i.e. first card with that word
+        for i, c in enumerate(_cards):
+            positions.setdefault(c[0], i)
         for m in missed:
-            for i, c in enumerate( _cards):
-                if c[0] == m[0]:
-                    break
-            print(f'{i}. {m[0]}')
+            print(f'{positions[m[0]]}. {m[0]}')
     else:
         print('\n\n' + 50*'_')
         if len(_cards) == 0:
@@ -795,6 +903,7 @@ def go(shuffle=True):
         _save(_cards)
 
 
+@lru_cache(maxsize=1)
 def _get_settingsfn():
     '''Get the pathname (path and name) to store user's settings.  The file
     will be named _settings.txt.  The pathname will be vary depending on who's
@@ -805,20 +914,21 @@ def _get_settingsfn():
     If the pathname does not already exists, it will be created, and default
     settings will be inserted into the file, i.e.
     {"maxtally": "10", "abort": "False",  ...}
+
+    The pathname can't change while the program runs, so it is only worked
+    out (and the file only created) on the first call.
     '''
 
-    if sys.platform[:3] == 'win':  # if a Window operating system being used.
+    if _is_win:  # if a Window operating system being used.
         datadir = os.getenv('LOCALAPPDATA')
         path = os.path.join(datadir, 'flashcardz')
-        if not os.path.isdir(path):
-            os.makedirs(path, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
         settingsfn = os.path.join(datadir, 'flashcardz', '_settings.txt')
 
-    elif sys.platform[:3] == 'lin':  # if a Linux operating system being used.
+    elif _is_lin:  # if a Linux operating system being used.
         homedir = os.path.expanduser('~')
         path = os.path.join(homedir, '.flashcardz')
-        if not os.path.isdir(path):
-            os.makedirs(path, exist_ok=True)
+        os.makedirs(path, exist_ok=True)
         settingsfn = os.path.join(homedir, '.flashcardz', '_settings.txt')
 
     else:
@@ -827,9 +937,12 @@ def _get_settingsfn():
         print(printStr)
         return ""
 
-    _bool = os.path.exists(settingsfn)
+    try:
+        need_init = os.stat(settingsfn).st_size == 0
+    except FileNotFoundError:
+        need_init = True
 
-    if not _bool or (_bool and os.path.getsize(settingsfn) == 0):
+    if need_init:
         fn_2_suggest = _suggest_fn()
         print('\n\n It appears this is your first time running this program.  A file\n'
               ' name needs to be established in which a new card deck will be\n'
@@ -842,20 +955,106 @@ def _get_settingsfn():
             fn = str(fn_2_suggest)
             print('\nProgram setting pathname set to:')
             print(f'    _settings["[pathname"] = {fn}')
-        with open(settingsfn, 'w') as file:
-            file.write(f'{{"pathname": "{fn}", "maxtally": "10", ' +
-                       '"tallypenalty": "10", ' +
-                       '"date_format": "%x", "abort": "False"}')
+        fn = fn.replace('\\', '/')  # see _read_settingsfn()
+        defaults = {"pathname": fn, "maxtally": "10", "tallypenalty": "10",
+                    "date_format": "%x", "abort": "False"}
+        try:
+            text = _settings_text(defaults)
+        except ValueError:  # e.g. a tab in the pathname
+            defaults['pathname'] = str(fn_2_suggest).replace('\\', '/')
+            print(f'\nPathname {fn!r} can not be used.  Using instead:')
+            print(f'    _settings["[pathname"] = {defaults["pathname"]}')
+            text = _settings_text(defaults)
+        Path(settingsfn).write_text(text)
     return settingsfn
 
 
+def _get_settings():
+    '''
+    Get the user's settings.  They are read from the settings file the first
+    time they are needed rather than when flashcardz is imported; on a first
+    run, reading them asks the user where to keep the deck of cards.
+
+    Returns
+    -------
+    _settings : dict | None
+        The settings, or None if the settings file could not be read.
+    '''
+    if _settings is None:
+        _read_settingsfn()
+    return _settings
+
+
+def _parse_settings(text):
+    '''
+    Convert the text of the settings file to a dict.  Settings are saved as
+    JSON.  Older versions of flashcardz saved them either as str(dict) or,
+    on a first run, with a raw Windows pathname, e.g. "C:\\Users\\Ken\\...",
+    whose backslashes are not valid escapes.  Those files are read by first
+    changing each backslash to a forward slash.
+
+    Parameters
+    ----------
+    text : str
+        Contents of the settings file.
+
+    Returns
+    -------
+    dict
+        The settings.
+
+    Raises
+    ------
+    ValueError
+        If the text can not be read as settings.
+    '''
+    try:
+        settings = json.loads(text)
+        # A raw Windows pathname can happen to be valid JSON, e.g.
+        # "D:\flashcards\new.txt", with \f and \n read as control characters.
+        if any(ord(c) < 32 for c in str(settings.get('pathname', ''))):
+            raise ValueError('pathname contains control characters')
+        return settings
+    except ValueError:  # settings saved by an older version
+        try:
+            return ast.literal_eval(text.replace('\\', '/'))
+        except (ValueError, SyntaxError) as e:
+            raise ValueError('settings could not be read: ' + repr(text)) from e
+
+
+def _settings_text(settings):
+    '''
+    Convert settings to the JSON text saved in the settings file.  The text
+    is read back with _parse_settings() before it is returned, so that
+    settings that would not survive the round trip are never saved.
+
+    Parameters
+    ----------
+    settings : dict
+        The settings to save.
+
+    Returns
+    -------
+    str
+        JSON text.
+
+    Raises
+    ------
+    ValueError
+        If the text would not be read back as the same settings.
+    '''
+    text = json.dumps(settings)  # ASCII only, whatever the locale encoding
+    if _parse_settings(text) != settings:
+        raise ValueError('settings would not be read back as saved: '
+                         + str(settings))
+    return text
+
+
 def _read_settingsfn():
     global _settings
     try:
         settingsfn = _get_settingsfn()
-        with open(settingsfn, 'r') as file:
-            x = file.read().replace('\\', '/')
-        _settings = ast.literal_eval(x)
+        _settings = _parse_settings(Path(settingsfn).read_text())
         _settings['maxtally'] = int(_settings['maxtally'])
         _settings['tallypenalty'] = int(_settings['tallypenalty'])
     except Exception as e:
@@ -871,8 +1070,11 @@ def _read_settingsfn():
 def _write_settingsfn():
     try:
         settingsfn = _get_settingsfn()
-        with open(settingsfn, 'w') as file:
-            file.write(str(_settings))
+        # Write to a temporary file, then swap it in, so that an interrupted
+        # write can't leave behind an empty or half-written settings file.
+        tmpfn = settingsfn + '.tmp'
+        Path(tmpfn).write_text(_settings_text(_settings))
+        os.replace(tmpfn, settingsfn)
     except Exception as e:
         msg = ("\nError at _write_settingsfn() function:\n\n"
                "Unable to save flashcardz data file.\n"
@@ -883,7 +1085,7 @@ def _write_settingsfn():
 
 def _suggest_fn():
     home_dir = Path.home()
-    doc_dir = Path.home().joinpath('Documents')
+    doc_dir = home_dir / 'Documents'
     if doc_dir.is_dir():
         return doc_dir / 'flashcardz.txt'
     elif home_dir.is_dir():
@@ -908,10 +1110,7 @@ def _hide_urls(text):
     Returns the same text less the URL and the parenthesis that
     inclosed that URL.
     """
-    tuples = re.findall(r'(\[.+?\])(\s*\(.+?\))', text)
-    for url in tuples:
-        text = text.replace(url[1], '')
-    return text
+    return _url_re.sub(r'\1', text)
 
 
 def _url_at(text, i):
@@ -927,15 +1126,9 @@ def _url_at(text, i):
     is returned.  And if i=3, then https://www.youtube.com/ is
     returned, and so forth"""
 
-    tuples = re.findall(r'(\[.+?\])(\s*\(.+?\))', text)
+    tuples = _url_re.findall(text)
     if 0 < i <= len(tuples):
-        try:
-            return tuples[i-1][1][1:-1]
-        except Exception as e:
-            msg = ('Error at function named _url_i:\n    '
-                   + str(e))
-            print(msg)
-            return None
+        return tuples[i-1][2]
     else:
         print('Error at function named _url_at.')
         print("    list index out of range")
@@ -953,6 +1146,14 @@ class HistoryConsole(code.InteractiveConsole):
         self.init_history(histfile)
 
     def init_history(self, histfile):
+        if not sys.stdin.isatty():  # e.g. input piped in; no line editing
+            return
+        # Only the interactive shell needs these, so import them here.
+        try:
+            import readline  # https://docs.python.org/3/library/readline.html
+        except ImportError:  # e.g. MS Windows; run the shell without history
+            return
+        import atexit
         readline.parse_and_bind("tab: complete")
         if hasattr(readline, "read_history_file"):
             try:
@@ -962,20 +1163,26 @@ class HistoryConsole(code.InteractiveConsole):
             atexit.register(self.save_history, histfile)
 
     def save_history(self, histfile):
+        try:
+            import readline
+        except ImportError:
+            return
         readline.set_history_length(1000)
         readline.write_history_file(histfile)
 
 
-_read_settingsfn()
-
-
-if __name__=='__main__':
+def main():
+    """Start flashcardz in its own interactive python shell.  This is what
+    runs when flashcardz is launched from the command line, e.g. by the
+    "flashcardz" command that pip installs."""
     try:
         __IPYTHON__
         _in_ipython_session = True
     except NameError:
         _in_ipython_session = False
 
+    _get_settings()  # on a first run, ask for the deck's pathname up front
+
     if _in_ipython_session:
         print(chr(128073) + ' For ipython do either "ipython -i flashcardz" or "from flashcardz import *"\n')
 
@@ -984,14 +1191,11 @@ if __name__=='__main__':
         banner = (f"\nflashcardz {__version__} running on python {vi[0]}.{vi[1]}.{vi[2]}.  Ctrl+D or quit() closes program.\n" +
                   'How-to instructions are at https://github.com/kcarlton55/flashcardz.\n' +
                   'Excecute "functions()" (w/o quotes) for info about running this program.\n')
-        variables = {**globals(), **locals()}
+        variables = dict(globals())
         #shell = code.InteractiveConsole(variables)
         shell = HistoryConsole(variables)
         shell.interact(banner=banner)
 
 
-
-
-
-
-
+if __name__=='__main__':
+    main()